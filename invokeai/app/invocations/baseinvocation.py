@@ -176,6 +176,10 @@ class BaseInvocation(ABC, BaseModel):
     """
 
     _invocation_classes: ClassVar[set[BaseInvocation]] = set()
+    # Allowed invocations, keyed by the (allowlist, denylist) they were computed with
+    _allowed_invocations_cache: ClassVar[
+        dict[tuple[Optional[frozenset[str]], Optional[frozenset[str]]], frozenset[BaseInvocation]]
+    ] = {}
     _typeadapter: ClassVar[Optional[TypeAdapter[Any]]] = None
     _typeadapter_needs_update: ClassVar[bool] = False
 
@@ -188,6 +192,10 @@ class BaseInvocation(ABC, BaseModel):
     def register_invocation(cls, invocation: BaseInvocation) -> None:
         """Registers an invocation."""
         cls._invocation_classes.add(invocation)
+        # Keep the cached results current, rather than rebuilding them for every registered invocation
+        for cache_key, allowed_invocations in cls._allowed_invocations_cache.items():
+            if cls._is_invocation_allowed(invocation.get_type(), *cache_key):
+                cls._allowed_invocations_cache[cache_key] = allowed_invocations | {invocation}
         cls._typeadapter_needs_update = True
 
     @classmethod
@@ -212,19 +220,26 @@ class BaseInvocation(ABC, BaseModel):
     def get_invocations(cls) -> Iterable[BaseInvocation]:
         """Gets all invocations, respecting the allowlist and denylist."""
         app_config = get_config()
-        allowed_invocations: set[BaseInvocation] = set()
-        for sc in cls._invocation_classes:
-            invocation_type = sc.get_type()
-            is_in_allowlist = (
-                invocation_type in app_config.allow_nodes if isinstance(app_config.allow_nodes, list) else True
-            )
-            is_in_denylist = (
-                invocation_type in app_config.deny_nodes if isinstance(app_config.deny_nodes, list) else False
-            )
-            if is_in_allowlist and not is_in_denylist:
-                allowed_invocations.add(sc)
+        allow_nodes = frozenset(app_config.allow_nodes) if isinstance(app_config.allow_nodes, list) else None
+        deny_nodes = frozenset(app_config.deny_nodes) if isinstance(app_config.deny_nodes, list) else None
+        cache_key = (allow_nodes, deny_nodes)
+        if (cached := cls._allowed_invocations_cache.get(cache_key)) is not None:
+            return cached
+
+        allowed_invocations = frozenset(
+            sc for sc in cls._invocation_classes if cls._is_invocation_allowed(sc.get_type(), allow_nodes, deny_nodes)
+        )
+        cls._allowed_invocations_cache[cache_key] = allowed_invocations
         return allowed_invocations
 
+    @staticmethod
+    def _is_invocation_allowed(
+        invocation_type: str, allow_nodes: Optional[frozenset[str]], deny_nodes: Optional[frozenset[str]]
+    ) -> bool:
+        is_in_allowlist = invocation_type in allow_nodes if allow_nodes is not None else True
+        is_in_denylist = invocation_type in deny_nodes if deny_nodes is not None else False
+        return is_in_allowlist and not is_in_denylist
+
     @classmethod
     def get_invocations_map(cls) -> dict[str, BaseInvocation]:
         """Gets a map of all invocation types to their invocation classes."""
@@ -1,6 +1,6 @@
 """Init file for InvokeAI configure package."""
 
 from invokeai.app.services.config.config_common import PagingArgumentParser
-from invokeai.app.services.config.config_default import InvokeAIAppConfig, get_config
+from invokeai.app.services.config.config_default import InvokeAIAppConfig, get_config, reset_config
 
-__all__ = ["InvokeAIAppConfig", "get_config", "PagingArgumentParser"]
+__all__ = ["InvokeAIAppConfig", "get_config", "reset_config", "PagingArgumentParser"]
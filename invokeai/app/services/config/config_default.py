@@ -9,7 +9,7 @@ import locale
 import os
 import re
 import shutil
-from functools import lru_cache
+import threading
 from pathlib import Path
 from typing import Any, Literal, Optional
 
@@ -21,6 +21,14 @@ import invokeai.configs as model_configs
 from invokeai.backend.model_hash.model_hash import HASHING_ALGORITHMS
 from invokeai.frontend.cli.arg_parser import InvokeAIArgs
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 INIT_FILE = Path("invokeai.yaml")
 DB_FILE = Path("invokeai.db")
 LEGACY_INIT_FILE = Path("invokeai.init")
@@ -247,11 +255,11 @@ class InvokeAIAppConfig(BaseSettings):
                 file.write("# You should not copy this whole file into your config.\n")
                 file.write("# Only add the settings you need to change to your config file.\n\n")
             file.write("# Internal metadata - do not edit:\n")
-            file.write(yaml.dump(meta_dict, sort_keys=False))
+            file.write(yaml.dump(meta_dict, Dumper=YamlDumper, sort_keys=False))
             file.write("\n")
             file.write("# Put user settings here - see https://invoke-ai.github.io/InvokeAI/configuration/:\n")
             if len(config_dict) > 0:
-                file.write(yaml.dump(config_dict, sort_keys=False))
+                file.write(yaml.dump(config_dict, Dumper=YamlDumper, sort_keys=False))
 
     def _resolve(self, partial_path: Path) -> Path:
         return (self.root_path / partial_path).resolve()
@@ -443,8 +451,9 @@ def load_and_migrate_config(config_path: Path) -> InvokeAIAppConfig:
         An instance of `InvokeAIAppConfig` with the loaded and migrated settings.
     """
     assert config_path.suffix == ".yaml"
-    with open(config_path, "rt", encoding=locale.getpreferredencoding()) as file:
-        loaded_config_dict: dict[str, Any] = yaml.safe_load(file)
+    # Read the file once - the raw contents are reused for the backup if we need to migrate
+    raw_config = config_path.read_bytes()
+    loaded_config_dict: dict[str, Any] = yaml.load(raw_config.decode(locale.getpreferredencoding()), Loader=YamlLoader)
 
     assert isinstance(loaded_config_dict, dict)
 
@@ -460,13 +469,16 @@ def load_and_migrate_config(config_path: Path) -> InvokeAIAppConfig:
         loaded_config_dict = migrate_v4_0_1_to_4_0_2_config_dict(loaded_config_dict)
 
     if migrated:
-        shutil.copy(config_path, config_path.with_suffix(".yaml.bak"))
+        backup_path = config_path.with_suffix(".yaml.bak")
+        backup_path.write_bytes(raw_config)
+        # The config may hold secrets (e.g. remote API tokens) - give the backup the same permissions as the original
+        shutil.copymode(config_path, backup_path)
         try:
             # load and write without environment variables
             migrated_config = DefaultInvokeAIAppConfig.model_validate(loaded_config_dict)
             migrated_config.write_file(config_path)
         except Exception as e:
-            shutil.copy(config_path.with_suffix(".yaml.bak"), config_path)
+            config_path.write_bytes(raw_config)
             raise RuntimeError(f"Failed to load and migrate v3 config file {config_path}: {e}") from e
 
     try:
@@ -480,7 +492,10 @@ def load_and_migrate_config(config_path: Path) -> InvokeAIAppConfig:
         raise RuntimeError(f"Failed to load config file {config_path}: {e}") from e
 
 
-@lru_cache(maxsize=1)
+_config: Optional[InvokeAIAppConfig] = None
+_config_lock = threading.Lock()
+
+
 def get_config() -> InvokeAIAppConfig:
     """Get the global singleton app config.
 
@@ -492,8 +507,28 @@ def get_config() -> InvokeAIAppConfig:
     - Copies all legacy configs to the legacy conf dir (needed for conversion from ckpt to diffusers).
     - Reads and merges in settings from the config file if it exists, else writes out a default config file.
 
-    On subsequent calls, the object is returned from the cache.
+    On subsequent calls, the object is returned from the cache. Call `reset_config()` to reset it.
     """
+    global _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            # Another thread may have created the config while we were waiting for the lock
+            if _config is None:
+                _config = _create_config()
+            config = _config
+    return config
+
+
+def reset_config() -> None:
+    """Reset the global singleton app config. The next call to `get_config` creates a new config object."""
+    global _config
+    with _config_lock:
+        _config = None
+
+
+def _create_config() -> InvokeAIAppConfig:
+    """Create the app config. See `get_config` for details."""
     # This object includes environment variables, as parsed by pydantic-settings
     config = InvokeAIAppConfig()
 
@@ -64,6 +64,14 @@ class InvocationStatsServiceBase(ABC):
         """Reset all stored statistics."""
         pass
 
+    @abstractmethod
+    def has_stats(self, graph_execution_state_id: str) -> bool:
+        """
+        Check whether statistics have been collected for the indicated graph.
+        :param graph_execution_state_id: The id of the session to check.
+        """
+        pass
+
     @abstractmethod
     def log_stats(self, graph_execution_state_id: str) -> None:
         """
@@ -90,6 +90,9 @@ class InvocationStatsService(InvocationStatsServiceBase):
             vram_usage_gb=vram_usage_gb,
         )
 
+    def has_stats(self, graph_execution_state_id: str) -> bool:
+        return graph_execution_state_id in self._stats and graph_execution_state_id in self._cache_stats
+
     def log_stats(self, graph_execution_state_id: str) -> None:
         stats = self.get_stats(graph_execution_state_id)
         logger.info(str(stats))
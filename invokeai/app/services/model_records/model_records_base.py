@@ -110,6 +110,18 @@ class ModelRecordServiceBase(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_models(self, configs: List[AnyModelConfig]) -> List[AnyModelConfig]:
+        """
+        Add several models to the database in a single transaction.
+
+        :param configs: Model configuration records to add.
+
+        If any of the models cannot be added, none of them are. Can raise
+        DuplicateModelException and InvalidModelConfigException exceptions.
+        """
+        pass
+
     @abstractmethod
     def del_model(self, key: str) -> None:
         """
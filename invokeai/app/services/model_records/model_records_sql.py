@@ -96,40 +96,52 @@ class ModelRecordServiceSQL(ModelRecordServiceBase):
 
         Can raise DuplicateModelException and InvalidModelConfigException exceptions.
         """
+        return self.add_models([config])[0]
+
+    def add_models(self, configs: List[AnyModelConfig]) -> List[AnyModelConfig]:
+        """
+        Add several models to the database in a single transaction.
+
+        :param configs: Model configuration records to add.
+
+        If any of the models cannot be added, none of them are. Can raise
+        DuplicateModelException and InvalidModelConfigException exceptions.
+        """
         with self._db.lock:
             try:
-                self._cursor.execute(
-                    """--sql
-                    INSERT INTO models (
-                       id,
-                       config
-                      )
-                    VALUES (?,?);
-                    """,
-                    (
-                        config.key,
-                        config.model_dump_json(),
-                    ),
-                )
+                for config in configs:
+                    try:
+                        self._cursor.execute(
+                            """--sql
+                            INSERT INTO models (
+                               id,
+                               config
+                              )
+                            VALUES (?,?);
+                            """,
+                            (
+                                config.key,
+                                config.model_dump_json(),
+                            ),
+                        )
+                    except sqlite3.IntegrityError as e:
+                        if "UNIQUE constraint failed" in str(e):
+                            if "models.path" in str(e):
+                                msg = f"A model with path '{config.path}' is already installed"
+                            elif "models.name" in str(e):
+                                msg = f"A model with name='{config.name}', type='{config.type}', base='{config.base}' is already installed"
+                            else:
+                                msg = f"A model with key '{config.key}' is already installed"
+                            raise DuplicateModelException(msg) from e
+                        else:
+                            raise e
                 self._db.conn.commit()
-
-            except sqlite3.IntegrityError as e:
+            except Exception:
+                # Don't leave any of the batch's inserts pending on the shared connection
                 self._db.conn.rollback()
-                if "UNIQUE constraint failed" in str(e):
-                    if "models.path" in str(e):
-                        msg = f"A model with path '{config.path}' is already installed"
-                    elif "models.name" in str(e):
-                        msg = f"A model with name='{config.name}', type='{config.type}', base='{config.base}' is already installed"
-                    else:
-                        msg = f"A model with key '{config.key}' is already installed"
-                    raise DuplicateModelException(msg) from e
-                else:
-                    raise e
-            except sqlite3.Error as e:
-                self._db.conn.rollback()
-                raise e
+                raise
 
-        return self.get_model(config.key)
+        return [self.get_model(config.key) for config in configs]
 
     def del_model(self, key: str) -> None:
         """
@@ -227,17 +239,16 @@ class ModelRecordServiceSQL(ModelRecordServiceBase):
 
         :param key: Unique key for the model to be deleted
         """
-        count = 0
         with self._db.lock:
             self._cursor.execute(
                 """--sql
-                select count(*) FROM models
-                WHERE id=?;
+                SELECT 1 FROM models
+                WHERE id=?
+                LIMIT 1;
                 """,
                 (key,),
             )
-            count = self._cursor.fetchone()[0]
-        return count > 0
+            return self._cursor.fetchone() is not None
 
     def search_by_attr(
         self,
@@ -1,7 +1,6 @@
 import traceback
-from contextlib import suppress
-from threading import BoundedSemaphore, Thread
 from threading import Event as ThreadEvent
+from threading import Lock, Thread
 from typing import Optional
 
 from invokeai.app.invocations.baseinvocation import BaseInvocation, BaseInvocationOutput
@@ -12,7 +11,6 @@ from invokeai.app.services.events.events_common import (
     QueueItemStatusChangedEvent,
     register_events,
 )
-from invokeai.app.services.invocation_stats.invocation_stats_common import GESStatsNotFoundError
 from invokeai.app.services.invoker import Invoker
 from invokeai.app.services.session_processor.session_processor_base import (
     InvocationServices,
@@ -31,6 +29,9 @@ from invokeai.app.services.shared.graph import NodeInputError
 from invokeai.app.services.shared.invocation_context import InvocationContextData, build_invocation_context
 from invokeai.app.util.profiler import Profiler
 
+# Queue items in these statuses are done - the session processor should stop executing them and move on
+TERMINAL_QUEUE_ITEM_STATUSES = frozenset(["completed", "failed", "canceled"])
+
 
 class DefaultSessionRunner(SessionRunnerBase):
     """Processes a single session's invocations."""
@@ -73,10 +74,12 @@ class DefaultSessionRunner(SessionRunnerBase):
 
         self._on_before_run_session(queue_item=queue_item)
 
+        session = queue_item.session
+
         # Loop over invocations until the session is complete or canceled
         while True:
             try:
-                invocation = queue_item.session.next()
+                invocation = session.next()
             # Anything other than a `NodeInputError` is handled as a processor error
             except NodeInputError as e:
                 error_type = e.__class__.__name__
@@ -99,16 +102,13 @@ class DefaultSessionRunner(SessionRunnerBase):
             # The session is complete if all invocations have been run or there is an error on the session.
             # At this time, the queue item may be canceled, but the object itself here won't be updated yet. We must
             # use the cancel event to check if the session is canceled.
-            if (
-                queue_item.session.is_complete()
-                or self._is_canceled()
-                or queue_item.status in ["failed", "canceled", "completed"]
-            ):
+            if session.is_complete() or self._is_canceled() or queue_item.status in TERMINAL_QUEUE_ITEM_STATUSES:
                 break
 
         self._on_after_run_session(queue_item=queue_item)
 
     def run_node(self, invocation: BaseInvocation, queue_item: SessionQueueItem):
+        session = queue_item.session
         try:
             # Any unhandled exception in this scope is an invocation error & will fail the graph
             with self._services.performance_statistics.collect_stats(invocation, queue_item.session_id):
@@ -116,7 +116,7 @@ class DefaultSessionRunner(SessionRunnerBase):
 
                 data = InvocationContextData(
                     invocation=invocation,
-                    source_invocation_id=queue_item.session.prepared_source_mapping[invocation.id],
+                    source_invocation_id=session.prepared_source_mapping[invocation.id],
                     queue_item=queue_item,
                 )
                 context = build_invocation_context(
@@ -128,7 +128,7 @@ class DefaultSessionRunner(SessionRunnerBase):
                 # Invoke the node
                 output = invocation.invoke_internal(context=context, services=self._services)
                 # Save output and history
-                queue_item.session.complete(invocation.id, output)
+                session.complete(invocation.id, output)
 
                 self._on_after_run_node(invocation, queue_item, output)
 
@@ -206,9 +206,9 @@ class DefaultSessionRunner(SessionRunnerBase):
             if queue_item.status not in ["canceled", "failed"]:
                 queue_item = self._services.session_queue.complete_queue_item(queue_item.item_id)
 
-            # We'll get a GESStatsNotFoundError if we try to log stats for an untracked graph, but in the processor
-            # we don't care about that - suppress the error.
-            with suppress(GESStatsNotFoundError):
+            # Stats are only tracked for graphs that ran at least one node - in the processor we don't care about
+            # untracked graphs, so only log stats if we have them.
+            if self._services.performance_statistics.has_stats(queue_item.session.id):
                 self._services.performance_statistics.log_stats(queue_item.session.id)
                 self._services.performance_statistics.reset_stats()
 
@@ -314,15 +314,39 @@ class DefaultSessionProcessor(SessionProcessorBase):
         on_non_fatal_processor_error_callbacks: Optional[list[OnNonFatalProcessorError]] = None,
         thread_limit: int = 1,
         polling_interval: int = 1,
+        idle_polling_interval: int = 60,
     ) -> None:
+        """
+        Args:
+            session_runner: The session runner to use. Defaults to a `DefaultSessionRunner`.
+            on_non_fatal_processor_error_callbacks: Callbacks to run when a non-fatal processor error occurs.
+            thread_limit: Unused - the processor always runs sessions on a single thread. Accepted for backwards
+                compatibility.
+            polling_interval: Seconds to wait before retrying after a non-fatal processor error.
+            idle_polling_interval: Seconds to wait for an event while the queue is empty. The processor is woken by
+                queue events as soon as there is work to do - this is only a safety net.
+        """
         super().__init__()
 
         self.session_runner = session_runner if session_runner else DefaultSessionRunner()
         self._on_non_fatal_processor_error_callbacks = on_non_fatal_processor_error_callbacks or []
-        self._thread_limit = thread_limit
         self._polling_interval = polling_interval
+        self._idle_polling_interval = idle_polling_interval
+        self._thread: Optional[Thread] = None
+        # Held while starting the processor thread, so the processor cannot be started twice.
+        self._start_lock = Lock()
 
     def start(self, invoker: Invoker) -> None:
+        with self._start_lock:
+            self._start(invoker)
+
+    def _start(self, invoker: Invoker) -> None:
+        # A stopped processor thread may still be finishing its current session. The new thread waits for it to exit,
+        # so only one thread ever processes sessions.
+        previous_thread = self._thread
+        if previous_thread is not None and previous_thread.is_alive() and not self._stop_event.is_set():
+            raise RuntimeError("Session processor is already running")
+
         self._invoker: Invoker = invoker
         self._queue_item: Optional[SessionQueueItem] = None
         self._invocation: Optional[BaseInvocation] = None
@@ -336,8 +360,6 @@ class DefaultSessionProcessor(SessionProcessorBase):
         register_events(BatchEnqueuedEvent, self._on_batch_enqueued)
         register_events(QueueItemStatusChangedEvent, self._on_queue_item_status_changed)
 
-        self._thread_semaphore = BoundedSemaphore(self._thread_limit)
-
         # If profiling is enabled, create a profiler. The same profiler will be used for all sessions. Internally,
         # the profiler will create a new profile for each session.
         self._profiler = (
@@ -359,18 +381,23 @@ class DefaultSessionProcessor(SessionProcessorBase):
                 "poll_now_event": self._poll_now_event,
                 "resume_event": self._resume_event,
                 "cancel_event": self._cancel_event,
+                "previous_thread": previous_thread,
             },
         )
         self._thread.start()
 
     def stop(self, *args, **kwargs) -> None:
         self._stop_event.set()
+        # Wake the processor thread if it is waiting for the next polling interval, so it sees the stop event now
+        self._poll_now()
 
     def _poll_now(self) -> None:
         self._poll_now_event.set()
 
     async def _on_queue_cleared(self, event: FastAPIEvent[QueueClearedEvent]) -> None:
-        if self._queue_item and self._queue_item.queue_id == event[1].queue_id:
+        # The processor thread may swap out the current queue item at any time - take a single snapshot of it
+        queue_item = self._queue_item
+        if queue_item and queue_item.queue_id == event[1].queue_id:
             self._cancel_event.set()
             self._poll_now()
 
@@ -378,10 +405,14 @@ class DefaultSessionProcessor(SessionProcessorBase):
         self._poll_now()
 
     async def _on_queue_item_status_changed(self, event: FastAPIEvent[QueueItemStatusChangedEvent]) -> None:
+        # The processor thread may swap out the current queue item at any time - take a single snapshot of it so the
+        # checks below are all made against the same queue item
+        queue_item = self._queue_item
+        payload = event[1]
         # Make sure the cancel event is for the currently processing queue item
-        if self._queue_item and self._queue_item.item_id != event[1].item_id:
+        if queue_item and queue_item.item_id != payload.item_id:
             return
-        if self._queue_item and event[1].status in ["completed", "failed", "canceled"]:
+        if queue_item and payload.status in TERMINAL_QUEUE_ITEM_STATUSES:
             # When the queue item is canceled via HTTP, the queue item status is set to `"canceled"` and this event is
             # emitted. We need to respond to this event and stop graph execution. This is done by setting the cancel
             # event, which the session runner checks between invocations. If set, the session runner loop is broken.
@@ -389,7 +420,7 @@ class DefaultSessionProcessor(SessionProcessorBase):
             # Long-running nodes that cannot be interrupted easily present a challenge. `denoise_latents` is one such
             # node, but it gets a step callback, called on each step of denoising. This callback checks if the queue item
             # is canceled, and if it is, raises a `CanceledException` to stop execution immediately.
-            if event[1].status == "canceled":
+            if payload.status == "canceled":
                 self._cancel_event.set()
             self._poll_now()
 
@@ -415,10 +446,12 @@ class DefaultSessionProcessor(SessionProcessorBase):
         poll_now_event: ThreadEvent,
         resume_event: ThreadEvent,
         cancel_event: ThreadEvent,
+        previous_thread: Optional[Thread] = None,
     ):
         try:
             # Any unhandled exception in this block is a fatal processor error and will stop the processor.
-            self._thread_semaphore.acquire()
+            if previous_thread is not None:
+                previous_thread.join()
             stop_event.clear()
             resume_event.set()
             cancel_event.clear()
@@ -434,9 +467,10 @@ class DefaultSessionProcessor(SessionProcessorBase):
                     self._queue_item = self._invoker.services.session_queue.dequeue()
 
                     if self._queue_item is None:
-                        # The queue was empty, wait for next polling interval or event to try again
-                        self._invoker.services.logger.debug("Waiting for next polling interval or event")
-                        poll_now_event.wait(self._polling_interval)
+                        # The queue was empty. Enqueuing a batch emits an event that wakes us up, so there is no need
+                        # to poll - wait for the event, with a long timeout only as a safety net.
+                        self._invoker.services.logger.debug("Waiting for next event")
+                        poll_now_event.wait(self._idle_polling_interval)
                         continue
 
                     self._invoker.services.logger.info(
@@ -460,6 +494,9 @@ class DefaultSessionProcessor(SessionProcessorBase):
                     # Wait for next polling interval or event to try again
                     poll_now_event.wait(self._polling_interval)
                     continue
+                finally:
+                    # Whether the session finished or errored, we are no longer processing it
+                    self._queue_item = None
         except Exception as e:
             # Fatal error in processor, log and pass - we're done here
             error_type = e.__class__.__name__
@@ -469,10 +506,9 @@ class DefaultSessionProcessor(SessionProcessorBase):
             self._invoker.services.logger.error(error_traceback)
             pass
         finally:
-            stop_event.clear()
+            # The stop event is left set - `start()` relies on it to tell a stopped thread from a running one
             poll_now_event.clear()
             self._queue_item = None
-            self._thread_semaphore.release()
 
     def _on_non_fatal_processor_error(
         self,
@@ -116,19 +116,26 @@ class MigrationSet:
 
     def __init__(self) -> None:
         self._migrations: set[Migration] = set()
+        # Index the migrations by from_version and to_version, so duplicate checks don't scan every migration.
+        self._migrations_by_from_version: dict[int, Migration] = {}
+        self._migrations_by_to_version: dict[int, Migration] = {}
+        self._latest_version = 0
 
     def register(self, migration: Migration) -> None:
         """Registers a migration."""
-        migration_from_already_registered = any(m.from_version == migration.from_version for m in self._migrations)
-        migration_to_already_registered = any(m.to_version == migration.to_version for m in self._migrations)
+        migration_from_already_registered = migration.from_version in self._migrations_by_from_version
+        migration_to_already_registered = migration.to_version in self._migrations_by_to_version
         if migration_from_already_registered or migration_to_already_registered:
             raise MigrationVersionError("Migration with from_version or to_version already registered")
         self._migrations.add(migration)
+        self._migrations_by_from_version[migration.from_version] = migration
+        self._migrations_by_to_version[migration.to_version] = migration
+        self._latest_version = max(self._latest_version, migration.to_version)
 
     def get(self, from_version: int) -> Optional[Migration]:
         """Gets the migration that may be run on the given database version."""
         # register() ensures that there is only one migration with a given from_version, so this is safe.
-        return next((m for m in self._migrations if m.from_version == from_version), None)
+        return self._migrations_by_from_version.get(from_version)
 
     def validate_migration_chain(self) -> None:
         """
@@ -158,6 +165,4 @@ class MigrationSet:
     @property
     def latest_version(self) -> int:
         """Gets latest to_version among registered migrations. Returns 0 if there are no migrations registered."""
-        if self.count == 0:
-            return 0
-        return sorted(self._migrations, key=lambda m: m.to_version)[-1].to_version
+        return self._latest_version
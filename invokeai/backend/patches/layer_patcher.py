@@ -49,8 +49,7 @@ class LayerPatcher:
             yield
         finally:
             # Restore directly patched layers.
-            for param_key, weight in original_weights.get_changed_weights():
-                cur_param = model.get_parameter(param_key)
+            for cur_param, weight in original_weights.get_changed_parameters(model):
                 cur_param.data = weight.to(dtype=cur_param.dtype, device=cur_param.device, copy=True)
 
             # Clear patches from all patched modules.
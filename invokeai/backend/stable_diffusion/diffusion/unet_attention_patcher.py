@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import List, Optional, TypedDict
+from typing import Iterable, List, Optional, TypedDict
 
 from diffusers.models import UNet2DConditionModel
 
@@ -21,14 +21,15 @@ class UNetAttentionPatcher:
     def __init__(self, ip_adapter_data: Optional[List[UNetIPAdapterData]]):
         self._ip_adapters = ip_adapter_data
 
-    def _prepare_attention_processors(self, unet: UNet2DConditionModel):
+    def _prepare_attention_processors(self, attn_processor_names: Iterable[str]):
         """Prepare a dict of attention processors that can be injected into a unet, and load the IP-Adapter attention
         weights into them (if IP-Adapters are being applied).
-        Note that the `unet` param is only used to determine attention block dimensions and naming.
+        Note that `attn_processor_names` are the names of the UNet's attention processors, in the order returned by
+        `unet.attn_processors`. They are used to determine attention block naming.
         """
         # Construct a dict of attention processors based on the UNet's architecture.
         attn_procs = {}
-        for idx, name in enumerate(unet.attn_processors.keys()):
+        for idx, name in enumerate(attn_processor_names):
             if name.endswith("attn1.processor") or self._ip_adapters is None:
                 # "attn1" processors do not use IP-Adapters.
                 attn_procs[name] = CustomAttnProcessor2_0()
@@ -55,8 +56,9 @@ class UNetAttentionPatcher:
     @contextmanager
     def apply_ip_adapter_attention(self, unet: UNet2DConditionModel):
         """A context manager that patches `unet` with CustomAttnProcessor2_0 attention layers."""
-        attn_procs = self._prepare_attention_processors(unet)
+        # `unet.attn_processors` walks the whole module tree - only do it once.
         orig_attn_processors = unet.attn_processors
+        attn_procs = self._prepare_attention_processors(orig_attn_processors.keys())
 
         try:
             # Note to future devs: set_attn_processor(...) does something slightly unexpected - it pops elements from
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 from contextlib import ExitStack, contextmanager
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
@@ -25,30 +26,22 @@ class ExtensionsManager:
 
     def add_extension(self, extension: ExtensionBase):
         self._extensions.append(extension)
-        self._regenerate_ordered_callbacks()
+        self._add_ordered_callbacks(extension)
 
-    def _regenerate_ordered_callbacks(self):
-        """Regenerates self._ordered_callbacks. Intended to be called each time a new extension is added."""
-        self._ordered_callbacks = {}
-
-        # Fill the ordered callbacks dictionary.
-        for extension in self._extensions:
-            for callback_type, callbacks in extension.get_callbacks().items():
-                if callback_type not in self._ordered_callbacks:
-                    self._ordered_callbacks[callback_type] = []
-                self._ordered_callbacks[callback_type].extend(callbacks)
-
-        # Sort each callback list.
-        for callback_type, callbacks in self._ordered_callbacks.items():
-            # Note that sorted() is stable, so if two callbacks have the same order, the order that they extensions were
-            # added will be preserved.
-            self._ordered_callbacks[callback_type] = sorted(callbacks, key=lambda x: x.metadata.order)
+    def _add_ordered_callbacks(self, extension: ExtensionBase):
+        """Merges the extension's callbacks into self._ordered_callbacks, keeping each callback list sorted by order."""
+        for callback_type, callbacks in extension.get_callbacks().items():
+            ordered_callbacks = self._ordered_callbacks.setdefault(callback_type, [])
+            for cb in callbacks:
+                # insort_right() inserts after any callbacks with the same order, so if two callbacks have the same
+                # order, the order that their extensions were added will be preserved.
+                bisect.insort_right(ordered_callbacks, cb, key=lambda x: x.metadata.order)
 
     def run_callback(self, callback_type: ExtensionCallbackType, ctx: DenoiseContext):
         if self._is_canceled and self._is_canceled():
             raise CanceledException
 
-        callbacks = self._ordered_callbacks.get(callback_type, [])
+        callbacks = self._ordered_callbacks.get(callback_type, ())
         for cb in callbacks:
             cb.function(ctx)
 
@@ -78,5 +71,5 @@ class ExtensionsManager:
 
         finally:
             with torch.no_grad():
-                for param_key, weight in original_weights.get_changed_weights():
-                    unet.get_parameter(param_key).copy_(weight)
+                for param, weight in original_weights.get_changed_parameters(unet):
+                    param.copy_(weight)
@@ -37,3 +37,15 @@ class OriginalWeightsStorage:
     def get_changed_weights(self) -> Iterator[Tuple[str, torch.Tensor]]:
         for key in self._changed_weights:
             yield key, self._weights[key]
+
+    def get_changed_parameters(self, model: torch.nn.Module) -> Iterator[Tuple[torch.nn.Parameter, torch.Tensor]]:
+        """Yield the `(parameter, original_weight)` pairs of `model` for all weights that have been changed."""
+        changed_weights = list(self.get_changed_weights())
+        if not changed_weights:
+            return
+
+        # Resolve all parameters in a single pass over the model, rather than walking the module tree from the root for
+        # each changed key.
+        params = dict(model.named_parameters(remove_duplicate=False))
+        for key, weight in changed_weights:
+            yield params[key], weight
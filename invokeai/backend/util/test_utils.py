@@ -1,4 +1,3 @@
-import contextlib
 from pathlib import Path
 from typing import Optional, Union
 
@@ -7,7 +6,9 @@ import torch
 
 from invokeai.app.services.model_manager import ModelManagerServiceBase
 from invokeai.app.services.model_records import UnknownModelException
-from invokeai.backend.model_manager import BaseModelType, LoadedModel, ModelType, SubModelType
+from invokeai.backend.model_manager import AnyModelConfig, BaseModelType, LoadedModel, ModelType, SubModelType
+
+ModelConfigCache = dict[tuple[str, BaseModelType, ModelType], AnyModelConfig]
 
 
 @pytest.fixture(scope="session")
@@ -15,6 +16,16 @@ def torch_device():
     return "cuda" if torch.cuda.is_available() else "cpu"
 
 
+@pytest.fixture(scope="session")
+def model_config_cache() -> ModelConfigCache:
+    """A session-wide cache of the model configs found or installed by `install_and_load_model`.
+
+    Only configs are cached - the models themselves are always loaded through the model manager, so its RAM cache stays
+    in control of what is kept in memory. The cache must only be used with a single (session-scoped) model manager.
+    """
+    return {}
+
+
 def install_and_load_model(
     model_manager: ModelManagerServiceBase,
     model_path_id_or_url: Union[str, Path],
@@ -22,6 +33,7 @@ def install_and_load_model(
     base_model: BaseModelType,
     model_type: ModelType,
     submodel_type: Optional[SubModelType] = None,
+    model_config_cache: Optional[ModelConfigCache] = None,
 ) -> LoadedModel:
     """Install a model if it is not already installed, then get the LoadedModel for that model.
 
@@ -35,17 +47,23 @@ def install_and_load_model(
         base_model (BaseModelType): The base model, forwarded to ModelManager.get_model(...).
         model_type (ModelType): The model type, forwarded to ModelManager.get_model(...).
         submodel_type (Optional[SubModelType]): The submodel type, forwarded to ModelManager.get_model(...).
+        model_config_cache (Optional[ModelConfigCache]): If provided (e.g. the `model_config_cache` fixture), the model
+            is only looked up or installed the first time it is requested.
 
     Returns:
         LoadedModelInfo
     """
+    cache_key = (model_name, base_model, model_type)
+    if model_config_cache is not None and cache_key in model_config_cache:
+        return model_manager.load.load_model(model_config_cache[cache_key], submodel_type)
+
     # If the requested model is already installed, return its LoadedModel
-    with contextlib.suppress(UnknownModelException):
-        # TODO: Replace with wrapper call
-        configs = model_manager.store.search_by_attr(
-            model_name=model_name, base_model=base_model, model_type=model_type
-        )
-        loaded_model: LoadedModel = model_manager.load.load_model(configs[0])
+    # TODO: Replace with wrapper call
+    configs = model_manager.store.search_by_attr(model_name=model_name, base_model=base_model, model_type=model_type)
+    if configs:
+        loaded_model: LoadedModel = model_manager.load.load_model(configs[0], submodel_type)
+        if model_config_cache is not None:
+            model_config_cache[cache_key] = configs[0]
         return loaded_model
 
     # Install the requested model.
@@ -54,7 +72,9 @@ def install_and_load_model(
     assert job.complete
 
     try:
-        loaded_model = model_manager.load.load_model(job.config_out)
+        loaded_model = model_manager.load.load_model(job.config_out, submodel_type)
+        if model_config_cache is not None and job.config_out is not None:
+            model_config_cache[cache_key] = job.config_out
         return loaded_model
     except UnknownModelException as e:
         raise Exception(
@@ -3,11 +3,11 @@
 """Little command-line utility for probing a model on disk."""
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import get_args
 
 from invokeai.backend.model_hash.model_hash import HASHING_ALGORITHMS
-from invokeai.backend.model_manager import InvalidModelConfigException, ModelProbe
 
 algos = ", ".join(set(get_args(HASHING_ALGORITHMS)))
 
@@ -25,9 +25,21 @@ parser.add_argument(
 )
 args = parser.parse_args()
 
-for path in args.model_path:
+# Importing the model manager pulls in torch and diffusers - defer it until the args are parsed, so `--help` and usage
+# errors return immediately.
+from invokeai.backend.model_manager import InvalidModelConfigException, ModelProbe  # noqa: E402
+
+
+def probe(path: Path) -> str:
     try:
         info = ModelProbe.probe(path, hash_algo=args.hash_algo)
-        print(f"{path}:{info.model_dump_json(indent=4)}")
+        return f"{path}:{info.model_dump_json(indent=4)}"
     except InvalidModelConfigException as exc:
-        print(exc)
+        return str(exc)
+
+
+# Probing is dominated by reading and hashing model files, so probe several models concurrently. map() yields results
+# in input order, so the output is the same as probing sequentially.
+with ThreadPoolExecutor(max_workers=min(8, len(args.model_path))) as executor:
+    for result in executor.map(probe, args.model_path):
+        print(result)
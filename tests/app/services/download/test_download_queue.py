@@ -11,7 +11,7 @@ from pydantic.networks import AnyHttpUrl
 from requests.sessions import Session
 from requests_testadapter import TestAdapter
 
-from invokeai.app.services.config import get_config
+from invokeai.app.services.config import get_config, reset_config
 from invokeai.app.services.config.config_default import URLRegexTokenPair
 from invokeai.app.services.download import DownloadJob, DownloadJobStatus, DownloadQueueService, MultiFileDownloadJob
 from invokeai.app.services.events.events_common import (
@@ -329,7 +329,7 @@ def clear_config() -> Generator[None, None, None]:
     try:
         yield None
     finally:
-        get_config.cache_clear()
+        reset_config()
 
 
 def test_tokens(tmp_path: Path, mm2_session: Session):
@@ -4,6 +4,7 @@ Test the refactored model config classes.
 
 from hashlib import sha256
 from typing import Any, Optional
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -36,7 +37,7 @@ from tests.fixtures.sqlite_database import create_mock_sqlite_database
 def store(
     datadir: Any,
 ) -> ModelRecordServiceSQL:
-    config = InvokeAIAppConfig()
+    config = InvokeAIAppConfig(use_memory_db=True)
     config._root = datadir
     logger = InvokeAILogger.get_logger(config=config)
     db = create_mock_sqlite_database(config, logger)
@@ -78,6 +79,37 @@ def test_raises_on_violating_uniqueness(store: ModelRecordServiceBase):
         store.add_model(config2)
 
 
+def test_add_models_is_atomic(store: ModelRecordServiceBase):
+    config1 = example_ti_config("key1")
+    config2 = config1.model_copy(deep=True)
+    config2.key = "key2"
+    with pytest.raises(DuplicateModelException):
+        store.add_models([config1, config2])
+    assert not store.exists("key1")
+    assert not store.exists("key2")
+
+
+def test_add_models_rolls_back_on_any_error(store: ModelRecordServiceBase):
+    config1 = example_ti_config("key1")
+    config2 = VAEDiffusersConfig(
+        key="key2",
+        path="/tmp/vae",
+        name="vae",
+        base=BaseModelType.StableDiffusion1,
+        type=ModelType.VAE,
+        hash="VAEHASH",
+        source="test/source",
+        source_type=ModelSourceType.Path,
+    )
+    with patch.object(VAEDiffusersConfig, "model_dump_json", side_effect=RuntimeError("serialization failed")):
+        with pytest.raises(RuntimeError):
+            store.add_models([config1, config2])
+    # Adding another model commits the connection - the failed batch must not be committed along with it
+    store.add_model(example_ti_config("key3").model_copy(update={"path": "/tmp/other.bin", "name": "other"}))
+    assert not store.exists("key1")
+    assert not store.exists("key2")
+
+
 def test_model_records_updates_model(store: ModelRecordServiceBase):
     config = example_ti_config("key1")
     store.add_model(config)
@@ -154,8 +186,7 @@ def test_filter(store: ModelRecordServiceBase):
         source="test/source",
         source_type=ModelSourceType.Path,
     )
-    for c in config1, config2, config3:
-        store.add_model(c)
+    store.add_models([config1, config2, config3])
     matches = store.search_by_attr(model_type=ModelType.Main)
     assert len(matches) == 2
     assert matches[0].name in {"config1", "config2"}
@@ -48,23 +48,25 @@ def build_dummy_sd15_unet_input(torch_device):
     ],
 )
 @pytest.mark.slow
-def test_ip_adapter_unet_patch(model_params, model_installer, torch_device):
+def test_ip_adapter_unet_patch(model_params, model_installer, torch_device, model_config_cache):
     """Smoke test that IP-Adapter weights can be loaded and used to patch a UNet."""
     ip_adapter_info = install_and_load_model(
-        model_installer=model_installer,
+        model_manager=model_installer,
         model_path_id_or_url=model_params["ip_adapter_model_id"],
         model_name=model_params["ip_adapter_model_name"],
         base_model=model_params["base_model"],
         model_type=ModelType.IPAdapter,
+        model_config_cache=model_config_cache,
     )
 
     unet_info = install_and_load_model(
-        model_installer=model_installer,
+        model_manager=model_installer,
         model_path_id_or_url=model_params["unet_model_id"],
         model_name=model_params["unet_model_name"],
         base_model=model_params["base_model"],
         model_type=ModelType.Main,
         submodel_type=SubModelType.UNet,
+        model_config_cache=model_config_cache,
     )
 
     dummy_unet_input = build_dummy_sd15_unet_input(torch_device)
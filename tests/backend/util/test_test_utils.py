@@ -0,0 +1,66 @@
+"""
+Test the model helpers in invokeai.backend.util.test_utils.
+"""
+
+from unittest.mock import Mock
+
+from invokeai.backend.model_manager import BaseModelType, ModelType, SubModelType
+from invokeai.backend.util.test_utils import install_and_load_model
+
+
+def test_install_and_load_model_caches_configs():
+    config = Mock()
+    model_manager = Mock()
+    model_manager.store.search_by_attr.return_value = [config]
+    model_config_cache = {}
+
+    for _ in range(2):
+        install_and_load_model(
+            model_manager=model_manager,
+            model_path_id_or_url="test/model",
+            model_name="test_model",
+            base_model=BaseModelType.StableDiffusion1,
+            model_type=ModelType.Main,
+            model_config_cache=model_config_cache,
+        )
+
+    # The config is only looked up once, but the model is always loaded through the model manager
+    model_manager.store.search_by_attr.assert_called_once()
+    assert model_manager.load.load_model.call_count == 2
+    model_manager.load.load_model.assert_called_with(config, None)
+    model_manager.install.heuristic_import.assert_not_called()
+    assert model_config_cache == {("test_model", BaseModelType.StableDiffusion1, ModelType.Main): config}
+
+
+def test_install_and_load_model_without_cache():
+    model_manager = Mock()
+    model_manager.store.search_by_attr.return_value = [Mock()]
+
+    for _ in range(2):
+        install_and_load_model(
+            model_manager=model_manager,
+            model_path_id_or_url="test/model",
+            model_name="test_model",
+            base_model=BaseModelType.StableDiffusion1,
+            model_type=ModelType.Main,
+        )
+
+    assert model_manager.store.search_by_attr.call_count == 2
+
+
+def test_install_and_load_model_installs_missing_model():
+    model_manager = Mock()
+    model_manager.store.search_by_attr.return_value = []
+    job = model_manager.install.heuristic_import.return_value
+
+    install_and_load_model(
+        model_manager=model_manager,
+        model_path_id_or_url="test/model",
+        model_name="test_model",
+        base_model=BaseModelType.StableDiffusion1,
+        model_type=ModelType.Main,
+        submodel_type=SubModelType.UNet,
+    )
+
+    model_manager.install.heuristic_import.assert_called_once_with("test/model")
+    model_manager.load.load_model.assert_called_once_with(job.config_out, SubModelType.UNet)
@@ -2,8 +2,8 @@
 # without needing to explicitly import them. (https://docs.pytest.org/en/6.2.x/fixture.html)
 
 
-# We import the model_installer and torch_device fixtures here so that they can be used by all tests. Flake8 does not
-# play well with fixtures (F401 and F811), so this is cleaner than importing in all files that use these fixtures.
+# We import the torch_device and model_config_cache fixtures here so that they can be used by all tests. Flake8 does
+# not play well with fixtures (F401 and F811), so this is cleaner than importing in all files that use these fixtures.
 import logging
 import shutil
 from pathlib import Path
@@ -20,6 +20,7 @@ from invokeai.app.services.invocation_services import InvocationServices
 from invokeai.app.services.invocation_stats.invocation_stats_default import InvocationStatsService
 from invokeai.app.services.invoker import Invoker
 from invokeai.backend.util.logging import InvokeAILogger
+from invokeai.backend.util.test_utils import model_config_cache, torch_device  # noqa: F401
 from tests.backend.model_manager.model_manager_fixtures import *  # noqa: F403
 from tests.fixtures.sqlite_database import create_mock_sqlite_database  # noqa: F401
 from tests.test_nodes import TestEventService
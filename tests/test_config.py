@@ -1,16 +1,18 @@
+import sys
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
-from invokeai.app.invocations.baseinvocation import BaseInvocation
+from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
+from invokeai.app.invocations.primitives import IntegerOutput
 from invokeai.app.services.config.config_default import (
     DefaultInvokeAIAppConfig,
     InvokeAIAppConfig,
     get_config,
     load_and_migrate_config,
+    reset_config,
 )
 from invokeai.app.services.shared.graph import Graph
 from invokeai.frontend.cli.arg_parser import InvokeAIArgs
@@ -135,6 +137,17 @@ def test_migrate_v3_backup(tmp_path: Path, patch_rootdir: None):
     assert temp_config_file.with_suffix(".yaml.bak").read_text() == v3_config
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file permissions only")
+def test_migrate_v3_backup_keeps_permissions(tmp_path: Path, patch_rootdir: None):
+    """Test that the backup of the config file has the same permissions as the original."""
+    temp_config_file = tmp_path / "temp_invokeai.yaml"
+    temp_config_file.write_text(v3_config)
+    temp_config_file.chmod(0o600)
+
+    load_and_migrate_config(temp_config_file)
+    assert temp_config_file.with_suffix(".yaml.bak").stat().st_mode & 0o777 == 0o600
+
+
 def test_failed_migrate_backup(tmp_path: Path, patch_rootdir: None):
     """Test the failed migration of the config file."""
     temp_config_file = tmp_path / "temp_invokeai.yaml"
@@ -166,19 +179,18 @@ def test_bails_on_config_with_unsupported_version(tmp_path: Path, patch_rootdir:
         load_and_migrate_config(temp_config_file)
 
 
-def test_write_config_to_file(patch_rootdir: None):
+def test_write_config_to_file(tmp_path: Path, patch_rootdir: None):
     """Test writing configuration to a file, checking for correct output."""
-    with TemporaryDirectory() as tmpdir:
-        temp_config_path = Path(tmpdir) / "invokeai.yaml"
-        config = InvokeAIAppConfig(host="192.168.1.1", port=8080)
-        config.write_file(temp_config_path)
-        # Load the file and check contents
-        with open(temp_config_path, "r") as file:
-            content = file.read()
-            # This is a default value, so it should not be in the file
-            assert "pil_compress_level" not in content
-            assert "host: 192.168.1.1" in content
-            assert "port: 8080" in content
+    temp_config_path = tmp_path / "invokeai.yaml"
+    config = InvokeAIAppConfig(host="192.168.1.1", port=8080)
+    config.write_file(temp_config_path)
+    # Load the file and check contents
+    with open(temp_config_path, "r") as file:
+        content = file.read()
+        # This is a default value, so it should not be in the file
+        assert "pil_compress_level" not in content
+        assert "host: 192.168.1.1" in content
+        assert "port: 8080" in content
 
 
 def test_update_config_with_dict(patch_rootdir: None):
@@ -199,22 +211,21 @@ def test_update_config_with_object(patch_rootdir: None):
     assert config.port == 6060
 
 
-def test_set_and_resolve_paths(patch_rootdir: None):
+def test_set_and_resolve_paths(tmp_path: Path, patch_rootdir: None):
     """Test setting root and resolving paths based on it."""
-    with TemporaryDirectory() as tmpdir:
-        config = InvokeAIAppConfig()
-        config._root = Path(tmpdir)
-        assert config.models_path == Path(tmpdir).resolve() / "models"
-        assert config.db_path == Path(tmpdir).resolve() / "databases" / "invokeai.db"
+    config = InvokeAIAppConfig()
+    config._root = tmp_path
+    assert config.models_path == tmp_path.resolve() / "models"
+    assert config.db_path == tmp_path.resolve() / "databases" / "invokeai.db"
 
 
 def test_singleton_behavior(patch_rootdir: None):
     """Test that get_config always returns the same instance."""
-    get_config.cache_clear()
+    reset_config()
     config1 = get_config()
     config2 = get_config()
     assert config1 is config2
-    get_config.cache_clear()
+    reset_config()
 
 
 def test_default_config(patch_rootdir: None):
@@ -241,9 +252,9 @@ def test_get_config_writing(patch_rootdir: None, monkeypatch: pytest.MonkeyPatch
 
     monkeypatch.setenv("INVOKEAI_ROOT", str(tmp_path))
     monkeypatch.setenv("INVOKEAI_HOST", "1.2.3.4")
-    get_config.cache_clear()
+    reset_config()
     config = get_config()
-    get_config.cache_clear()
+    reset_config()
     config_file_path = tmp_path / "invokeai.yaml"
     example_file_path = config_file_path.with_suffix(".example.yaml")
     assert config.config_file_path == config_file_path
@@ -295,5 +306,24 @@ def test_deny_nodes(patch_rootdir):
     assert not has_float
 
     # Reset the config so that it doesn't affect other tests
-    get_config.cache_clear()
+    reset_config()
     BaseInvocation.invalidate_typeadapter()
+
+
+def test_get_invocations_includes_invocations_registered_after_caching(patch_rootdir):
+    # Populate the allowed invocations cache before registering a new invocation
+    assert "test_late_registration" not in BaseInvocation.get_invocation_types()
+
+    @invocation("test_late_registration", version="1.0.0")
+    class LateRegistrationInvocation(BaseInvocation):
+        def invoke(self, context) -> IntegerOutput:
+            return IntegerOutput(value=0)
+
+    try:
+        assert LateRegistrationInvocation in BaseInvocation.get_invocations()
+        assert "test_late_registration" in BaseInvocation.get_invocation_types()
+    finally:
+        # Unregister the invocation so that it doesn't affect other tests
+        BaseInvocation._invocation_classes.discard(LateRegistrationInvocation)
+        BaseInvocation._allowed_invocations_cache.clear()
+        BaseInvocation.invalidate_typeadapter()